@@ -33,20 +33,26 @@ class DiffAnalyzer:
     """Utility class that extracts quick insights from git diffs."""
 
     def summarize(self, diff_text: str) -> DiffSummary:
+        return self.summarize_stream(diff_text.splitlines())
+
+    def summarize_stream(self, lines: Iterable[str]) -> DiffSummary:
+        """Summarize a diff fed line by line, e.g. straight from a git pipe."""
+
         additions: Counter[str] = Counter()
         deletions: Counter[str] = Counter()
 
-        for block in diff_text.split("\n@@"):
-            if "@@" not in block:
+        in_hunk = False
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if line.startswith("@@"):
+                in_hunk = True
+                continue
+            if not in_hunk or line.startswith("+++ ") or line.startswith("--- "):
                 continue
-            _, _, content = block.partition("@@")
-            for line in content.splitlines():
-                if line.startswith("+++ ") or line.startswith("--- "):
-                    continue
-                if line.startswith("+"):
-                    additions[line[1:].lstrip()] += 1
-                elif line.startswith("-"):
-                    deletions[line[1:].lstrip()] += 1
+            if line.startswith("+"):
+                additions[line[1:].lstrip()] += 1
+            elif line.startswith("-"):
+                deletions[line[1:].lstrip()] += 1
 
         total_changes = sum(additions.values()) + sum(deletions.values())
         return DiffSummary(total_changes=total_changes, additions=dict(additions), deletions=dict(deletions))
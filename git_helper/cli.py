@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
@@ -17,7 +18,7 @@ from .core.github import GitHubService, GitHubServiceError
 from .ui import CommandPalette, PaletteCommand
 from .utils import ConfigManager, TokenManager, configure_logging
 from .utils.token_manager import TokenManagerError
-from .utils.updater import check_for_update
+from .utils.updater import ReleaseInfo, start_update_check_async
 from .gui.app import MissingGuiDependencies, launch_gui
 
 console = Console()
@@ -98,6 +99,19 @@ def _github_service(token_manager: TokenManager) -> Optional[GitHubService]:
         return None
 
 
+def _report_update(update_check: Future, timeout: float = 0.05) -> None:
+    """Print the update notice if the background check finished in time."""
+
+    try:
+        release: Optional[ReleaseInfo] = update_check.result(timeout=timeout)
+    except Exception:
+        return
+    if release:
+        console.print(
+            f"[yellow]Update available: {release.tag_name} — {release.html_url}[/yellow]"
+        )
+
+
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
@@ -135,11 +149,8 @@ def main(
             raise typer.Exit(1)
         raise typer.Exit()
     console.print(f"[bold cyan]gitHelper[/bold cyan] v{__version__}")
-    release = check_for_update(__version__)
-    if release:
-        console.print(
-            f"[yellow]Update available: {release.tag_name} — {release.html_url}[/yellow]"
-        )
+    update_check = start_update_check_async(__version__)
+    ctx.call_on_close(lambda: _report_update(update_check))
     if ctx.invoked_subcommand is None and not ctx.resilient_parsing:
         palette(ctx)
 
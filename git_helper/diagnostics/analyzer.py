@@ -52,8 +52,13 @@ class DiffAnalyzer:
         return "\n".join(line for line in diff.splitlines() if pattern.search(line))
 
     def _summarize_changes(self, diff_text: str) -> DiffSummary:
-        additions = sum(1 for line in diff_text.splitlines() if line.startswith("+") and not line.startswith("+++"))
-        deletions = sum(1 for line in diff_text.splitlines() if line.startswith("-") and not line.startswith("---"))
+        additions = deletions = 0
+        for line in diff_text.splitlines():
+            if line.startswith("+"):
+                if not line.startswith("+++"):
+                    additions += 1
+            elif line.startswith("-") and not line.startswith("---"):
+                deletions += 1
         files = len(re.findall(r"^diff --git", diff_text, flags=re.MULTILINE))
         preview = diff_text[:2000]
         return DiffSummary(files_changed=files, additions=additions, deletions=deletions, preview=preview)
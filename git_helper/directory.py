@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import List
 
@@ -83,9 +84,9 @@ class RepositoryDirectoryManager:
                 f"Configured repository directory {base} is not accessible."
             )
         repos: List[Path] = []
-        for child in base.iterdir():
-            if not child.is_dir():
-                continue
-            if (child / ".git").is_dir():
-                repos.append(child)
+        # DirEntry.is_dir() reuses the type reported by readdir, saving a stat per child.
+        with os.scandir(base) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.isdir(os.path.join(entry.path, ".git")):
+                    repos.append(Path(entry.path))
         return sorted(repos)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import contextlib
 import subprocess
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
 from .git import GitRepository, GitRepositoryError
 
@@ -56,6 +58,31 @@ class GitCore:
             raise GitCommandError(message)
         return result
 
+    def _stream(self, *args: str, check: bool = True) -> Iterator[str]:
+        command = ("git", *args)
+        # stderr goes to a file (or nowhere) rather than a second pipe: nobody
+        # reads it until stdout hits EOF, so a full stderr pipe would deadlock git.
+        with tempfile.TemporaryFile(mode="w+") if check else contextlib.nullcontext() as stderr_file:
+            try:
+                process = subprocess.Popen(
+                    command,
+                    cwd=self.path,
+                    text=True,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file if check else subprocess.DEVNULL,
+                    bufsize=65536,
+                )
+            except FileNotFoundError as exc:  # pragma: no cover - environment specific
+                raise GitCommandError("The 'git' executable is required but was not found.") from exc
+            with process:
+                assert process.stdout is not None
+                yield from process.stdout
+                returncode = process.wait()
+            if check and returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read()
+                raise GitCommandError(stderr.strip() or f"git {' '.join(args)} failed with exit code {returncode}")
+
     # ------------------------------------------------------------------ discovery
     def status(self) -> str:
         return self.repository.status()
@@ -70,6 +97,12 @@ class GitCore:
         result = self._run("log", f"-{limit}", "--oneline", check=False)
         return result.stdout.strip() or "No commits yet."
 
+    def log_iter(self, limit: int = 10) -> Iterator[str]:
+        """Yield ``git log --oneline`` entries one at a time."""
+
+        for line in self._stream("log", f"-{limit}", "--oneline", check=False):
+            yield line.rstrip("\n")
+
     # ---------------------------------------------------------------- operations
     def stage_all(self) -> None:
         self.repository.stage_all()
@@ -127,6 +160,14 @@ class GitCore:
             raise GitCommandError("No git arguments supplied.")
         return self._run(*args_tuple)
 
+    def stream_custom(self, args: Iterable[str]) -> Iterator[str]:
+        """Yield the stdout lines of a git command as they are produced."""
+
+        args_tuple = tuple(args)
+        if not args_tuple:
+            raise GitCommandError("No git arguments supplied.")
+        return self._stream(*args_tuple)
+
     # --------------------------------------------------------------- utilities
     def ensure_repository(self) -> None:
         try:
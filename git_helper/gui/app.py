@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-import datetime
+import functools
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ..diagnostics import DiagnosticEngine
 from ..analyzer import DiffAnalyzer, DiffSummary
@@ -18,8 +23,8 @@ from ..tracer import FunctionTracer
 
 try:  # pragma: no cover - optional GUI dependency
     from kivy.clock import Clock
+    from kivy.factory import Factory
     from kivy.lang import Builder
-    from kivy.properties import BooleanProperty, StringProperty
     from kivymd.app import MDApp
     from kivymd.uix.boxlayout import MDBoxLayout
     from kivymd.uix.list import (
@@ -34,6 +39,7 @@ try:  # pragma: no cover - optional GUI dependency
     from kivymd.uix.label import MDLabel
     from kivymd.uix.appbar import MDTopAppBar
     from kivymd.uix.screen import MDScreen
+    from kivy.uix.recycleview import RecycleView
     from kivy.uix.screenmanager import ScreenManager
 except ModuleNotFoundError:  # pragma: no cover - executed when GUI deps missing
     MDApp = None  # type: ignore[assignment]
@@ -53,7 +59,7 @@ KV_DEFINITION = """
         active: root.active
         on_active: app.on_plugin_toggle(root.plugin_name, self.active)
 
-MDNavigationLayout:
+<GitHelperRoot@MDNavigationLayout>:
     ScreenManager:
         id: screen_manager
         MDScreen:
@@ -63,9 +69,15 @@ MDNavigationLayout:
                 MDTopAppBar:
                     title: "Repositories"
                     left_action_items: [["menu", lambda x: nav_drawer.set_state("toggle")]]
-                ScrollView:
-                    MDList:
-                        id: repo_list
+                RecycleView:
+                    id: repo_list
+                    viewclass: "OneLineListItem"
+                    RecycleBoxLayout:
+                        orientation: "vertical"
+                        default_size: None, dp(48)
+                        default_size_hint: 1, None
+                        size_hint_y: None
+                        height: self.minimum_height
                 MDBoxLayout:
                     adaptive_height: True
                     padding: "12dp"
@@ -89,9 +101,15 @@ MDNavigationLayout:
                 MDTopAppBar:
                     title: "SSH Manager"
                     left_action_items: [["menu", lambda x: nav_drawer.set_state("toggle")]]
-                ScrollView:
-                    MDList:
-                        id: ssh_keys
+                RecycleView:
+                    id: ssh_keys
+                    viewclass: "OneLineListItem"
+                    RecycleBoxLayout:
+                        orientation: "vertical"
+                        default_size: None, dp(48)
+                        default_size_hint: 1, None
+                        size_hint_y: None
+                        height: self.minimum_height
         MDScreen:
             name: "plugins"
             MDBoxLayout:
@@ -99,9 +117,15 @@ MDNavigationLayout:
                 MDTopAppBar:
                     title: "Plugin Centre"
                     left_action_items: [["menu", lambda x: nav_drawer.set_state("toggle")]]
-                ScrollView:
-                    MDList:
-                        id: plugin_list
+                RecycleView:
+                    id: plugin_list
+                    viewclass: "PluginToggle"
+                    RecycleBoxLayout:
+                        orientation: "vertical"
+                        default_size: None, dp(48)
+                        default_size_hint: 1, None
+                        size_hint_y: None
+                        height: self.minimum_height
         MDScreen:
             name: "diagnostics"
             MDBoxLayout:
@@ -242,9 +266,27 @@ class MissingGuiDependencies(RuntimeError):
 
 if MDApp:  # pragma: no cover - executed only when GUI dependencies installed
 
-    class PluginToggle(OneLineAvatarIconListItem):
-        plugin_name = StringProperty()
-        active = BooleanProperty(True)
+    _KV_LOADED = False
+
+    def _load_kv_rules() -> None:
+        """Parse KV_DEFINITION once per process; ``build`` only instantiates the root rule."""
+
+        global _KV_LOADED
+        if not _KV_LOADED:
+            Builder.load_string(KV_DEFINITION)
+            _KV_LOADED = True
+
+    def _on_ui_thread(method: Callable[..., Any]) -> Callable[..., Any]:
+        """Run ``method`` on the Kivy thread, deferring it when called from a worker."""
+
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if threading.current_thread() is threading.main_thread():
+                return method(*args, **kwargs)
+            Clock.schedule_once(lambda *_: method(*args, **kwargs))
+            return None
+
+        return wrapper
 
 
     class GitHelperApp(MDApp):
@@ -255,25 +297,49 @@ if MDApp:  # pragma: no cover - executed only when GUI dependencies installed
             self.settings = SettingsManager()
             self.repo_path = Path(path or Path.cwd())
             self.git = GitCore(self.repo_path)
-            self.repo_manager = RepoManager()
-            self.ssh = SSHTools()
             self.plugins = PluginManager(self.git)
-            self.diagnostics = DiagnosticEngine(self.git)
-            self.github_pages = GitHubPagesManager(self.git)
-            self.command_log: list[str] = []
+            self.command_log: deque[str] = deque(maxlen=50)
+            self._log_widgets: deque[OneLineListItem] = deque(maxlen=50)
             self.requested_theme = theme or self.settings.get("theme", "system")
             self.tracer = FunctionTracer()
             self.diff_analyzer = DiffAnalyzer()
             self._latest_diff_summary: DiffSummary | None = None
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="githelper-gui")
+            # Everything that runs git against the working tree shares one worker,
+            # so a bisect checking out commits never races a status read or plugin.
+            self._git_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="githelper-git")
+            self._code_break_future: Future | None = None
+            self._tracer_dirty = False
+            self._snackbar: Snackbar | None = None
+
+        # Screen-specific subsystems are only built once something touches them.
+        @functools.cached_property
+        def repo_manager(self) -> RepoManager:
+            return RepoManager()
+
+        @functools.cached_property
+        def ssh(self) -> SSHTools:
+            return SSHTools()
+
+        @functools.cached_property
+        def diagnostics(self) -> DiagnosticEngine:
+            return DiagnosticEngine(self.git)
+
+        @functools.cached_property
+        def github_pages(self) -> GitHubPagesManager:
+            return GitHubPagesManager(self.git)
 
         def build(self):  # type: ignore[override]
             self.title = "gitHelper GUI"
-            root = Builder.load_string(KV_DEFINITION)
+            _load_kv_rules()
+            root = Factory.GitHelperRoot()
             Clock.schedule_once(lambda *_: self._post_build())
             return root
 
         # ------------------------------------------------------------------ startup
         def _post_build(self) -> None:
+            # Refreshers fetch in the background, so their filesystem work overlaps
+            # with the (serialized) git reads instead of blocking the first frame.
             self.apply_theme(self.requested_theme)
             self.refresh_repositories()
             self.refresh_git_log()
@@ -283,6 +349,29 @@ if MDApp:  # pragma: no cover - executed only when GUI dependencies installed
             self.refresh_tracer_view()
             self.display_diff_summary(None)
 
+        def on_stop(self) -> None:  # type: ignore[override]
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._git_executor.shutdown(wait=False, cancel_futures=True)
+
+        # -------------------------------------------------------------- background
+        def _run_in_background(
+            self,
+            func: Callable[..., Any],
+            *args: Any,
+            on_done: Callable[[Future], None],
+            git: bool = False,
+        ) -> Future:
+            """Run ``func`` on the worker pool and hand the future back on the Kivy thread.
+
+            Pass ``git=True`` when ``func`` runs git in the repository; such jobs
+            queue on a single worker instead of running alongside each other.
+            """
+
+            executor = self._git_executor if git else self._executor
+            future = executor.submit(func, *args)
+            future.add_done_callback(lambda fut: Clock.schedule_once(lambda *_: on_done(fut)))
+            return future
+
         # ----------------------------------------------------------------- theming
         def apply_theme(self, theme: str | None) -> None:
             if not theme or theme == "system":
@@ -307,6 +396,8 @@ if MDApp:  # pragma: no cover - executed only when GUI dependencies installed
         def switch_screen(self, name: str) -> None:
             self.root.ids.screen_manager.current = name
             self.root.ids.nav_drawer.set_state("close")
+            if name == "tracer" and self._tracer_dirty:
+                self.refresh_tracer_view()
 
         # ---------------------------------------------------------------- commands
         def prompt(self, message: str) -> str:
@@ -314,18 +405,47 @@ if MDApp:  # pragma: no cover - executed only when GUI dependencies installed
             self.log_message(f"Prompt requested: {message}")
             return ""
 
+        @_on_ui_thread
         def show_popup(self, title: str, body: str) -> None:
-            Snackbar(text=f"{title}: {body}", duration=3).open()
-
+            if self._snackbar is None:
+                self._snackbar = Snackbar(duration=3)
+            self._snackbar.text = f"{title}: {body}"
+            # An attached snackbar is still on screen; swapping its text is enough.
+            if self._snackbar.parent is None:
+                self._snackbar.open()
+
+        @_on_ui_thread
         def log_message(self, message: str) -> None:
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            entry = f"[{timestamp}] {message}"
+            now = time.localtime()
+            entry = f"[{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}] {message}"
             self.command_log.append(entry)
             git_log = self.root.ids.get("git_log")
             if isinstance(git_log, MDList):
-                git_log.clear_widgets()
-                for item in self.command_log[-50:]:
-                    git_log.add_widget(OneLineListItem(text=item))
+                if len(self._log_widgets) == self._log_widgets.maxlen:
+                    git_log.remove_widget(self._log_widgets.popleft())
+                item = OneLineListItem(text=entry)
+                git_log.add_widget(item)
+                self._log_widgets.append(item)
+
+        @staticmethod
+        def _fill_list(list_widget: MDList, texts: list[str]) -> None:
+            """Show ``texts`` top to bottom, re-texting the list's existing items first."""
+
+            # MDList lays children out in reverse, so the top row is the last child.
+            items = list(reversed(list_widget.children))
+            for item in items[len(texts):]:
+                list_widget.remove_widget(item)
+            for item, text in zip(items, texts):
+                item.text = text
+            for text in texts[len(items):]:
+                list_widget.add_widget(OneLineListItem(text=text))
+
+        @staticmethod
+        def _set_view_data(view: RecycleView, data: list[dict[str, Any]]) -> None:
+            # Re-assigning identical data would still rebind every visible row
+            # (and replay each PluginToggle's switch), so leave it alone.
+            if data != view.data:
+                view.data = data
 
         # ---------------------------------------------------------------- refreshers
         def record_trace(self, name: str, *args: Any, metadata: dict[str, Any] | None = None, **kwargs: Any) -> None:
@@ -333,76 +453,114 @@ if MDApp:  # pragma: no cover - executed only when GUI dependencies installed
             self.refresh_tracer_view()
 
         def refresh_status(self) -> None:
-            status_label = self.root.ids.get("status_label")
-            if not status_label:
+            if not self.root.ids.get("status_label"):
                 return
-            try:
-                branch = self.git.current_branch() or "detached"
-                tracking = self.git.tracking_branch() or "no upstream"
-                status = self.git.status()
-                status_label.text = f"Branch: {branch} | Tracking: {tracking}\n{status}"
-                self.record_trace(
-                    "refresh_status",
-                    metadata={"branch": branch, "tracking": tracking},
-                )
-            except GitCommandError as exc:
+            self._run_in_background(self._read_status, on_done=self._apply_status, git=True)
+
+        def _read_status(self) -> tuple[str, str, str]:
+            branch = self.git.current_branch() or "detached"
+            tracking = self.git.tracking_branch() or "no upstream"
+            return branch, tracking, self.git.status()
+
+        def _apply_status(self, future: Future) -> None:
+            status_label = self.root.ids.status_label
+            exc = future.exception()
+            if exc is not None:
                 status_label.text = f"Status unavailable: {exc}"
                 self.record_trace("refresh_status", metadata={"error": str(exc)})
+                return
+            branch, tracking, status = future.result()
+            status_label.text = f"Branch: {branch} | Tracking: {tracking}\n{status}"
+            self.record_trace(
+                "refresh_status",
+                metadata={"branch": branch, "tracking": tracking},
+            )
 
         def refresh_repositories(self) -> None:
-            repo_list = self.root.ids.get("repo_list")
-            if not isinstance(repo_list, MDList):
+            if not isinstance(self.root.ids.get("repo_list"), RecycleView):
                 return
-            repo_list.clear_widgets()
-            try:
-                repositories = self.repo_manager.list()
-            except Exception as exc:  # pragma: no cover - depends on configuration
+            self._run_in_background(self.repo_manager.list, on_done=self._apply_repositories)
+
+        def _apply_repositories(self, future: Future) -> None:
+            repo_list = self.root.ids.repo_list
+            exc = future.exception()
+            if exc is not None:  # pragma: no cover - depends on configuration
                 repositories = []
                 self.log_message(f"Failed to list repositories: {exc}")
                 self.record_trace("refresh_repositories", metadata={"error": str(exc)})
+            else:
+                repositories = future.result()
             if not repositories:
-                repo_list.add_widget(OneLineListItem(text="No repositories configured."))
+                self._set_view_data(repo_list, [{"text": "No repositories configured."}])
                 self.record_trace("refresh_repositories", metadata={"count": 0})
-            for repo in repositories:
-                item = OneLineListItem(text=str(repo))
-                repo_list.add_widget(item)
-            if repositories:
-                self.record_trace("refresh_repositories", metadata={"count": len(repositories)})
+                return
+            self._set_view_data(repo_list, [{"text": str(repo)} for repo in repositories])
+            self.record_trace("refresh_repositories", metadata={"count": len(repositories)})
 
         def refresh_git_log(self) -> None:
-            try:
-                history = self.git.log(limit=20)
-            except GitCommandError as exc:
-                history = str(exc)
-            self.log_message(history)
-            if isinstance(history, str):
-                self.record_trace("refresh_git_log", metadata={"length": len(history)})
+            self._run_in_background(self._read_log, on_done=self._apply_log, git=True)
+
+        def _read_log(self) -> list[str]:
+            return list(self.git.log_iter(limit=20)) or ["No commits yet."]
+
+        def _apply_log(self, future: Future) -> None:
+            exc = future.exception()
+            entries = [str(exc)] if exc is not None else future.result()
+            for entry in entries:
+                self.log_message(entry)
+            self.record_trace("refresh_git_log", metadata={"entries": len(entries)})
 
         def refresh_ssh_keys(self) -> None:
-            ssh_list = self.root.ids.get("ssh_keys")
-            if not isinstance(ssh_list, MDList):
+            if not isinstance(self.root.ids.get("ssh_keys"), RecycleView):
                 return
-            ssh_list.clear_widgets()
-            for key in self.ssh.list_keys():
-                ssh_list.add_widget(OneLineListItem(text=str(key)))
-            if not ssh_list.children:
-                ssh_list.add_widget(OneLineListItem(text="No SSH keys found."))
-                self.record_trace("refresh_ssh_keys", metadata={"count": 0})
+            self._run_in_background(self.ssh.list_keys, on_done=self._apply_ssh_keys)
+
+        def _apply_ssh_keys(self, future: Future) -> None:
+            ssh_list = self.root.ids.ssh_keys
+            exc = future.exception()
+            if exc is not None:  # pragma: no cover - depends on filesystem
+                keys = []
+                self.log_message(f"Failed to list SSH keys: {exc}")
             else:
-                self.record_trace("refresh_ssh_keys", metadata={"count": len(ssh_list.children)})
+                keys = future.result()
+            if not keys:
+                self._set_view_data(ssh_list, [{"text": "No SSH keys found."}])
+                self.record_trace("refresh_ssh_keys", metadata={"count": 0})
+                return
+            self._set_view_data(ssh_list, [{"text": str(key)} for key in keys])
+            self.record_trace("refresh_ssh_keys", metadata={"count": len(keys)})
 
         def refresh_plugins(self) -> None:
-            plugin_list = self.root.ids.get("plugin_list")
-            if not isinstance(plugin_list, MDList):
+            if not isinstance(self.root.ids.get("plugin_list"), RecycleView):
+                return
+            self._run_in_background(
+                lambda: self.plugins.discover(force=True),
+                on_done=self._apply_plugins,
+            )
+
+        def _apply_plugins(self, future: Future) -> None:
+            plugin_list = self.root.ids.plugin_list
+            exc = future.exception()
+            if exc is not None:  # pragma: no cover - plugin behaviour varies
+                self.log_message(f"Failed to discover plugins: {exc}")
                 return
-            plugin_list.clear_widgets()
-            for state in self.plugins.discover(force=True):
-                toggle = PluginToggle(plugin_name=state.plugin.name, active=state.enabled)
-                plugin_list.add_widget(toggle)
-            self.record_trace("refresh_plugins", metadata={"count": len(plugin_list.children)})
+            self._set_view_data(
+                plugin_list,
+                [{"plugin_name": state.plugin.name, "active": state.enabled} for state in future.result()],
+            )
+            self.record_trace("refresh_plugins", metadata={"count": len(plugin_list.data)})
 
         # --------------------------------------------------------------- plugin API
         def on_plugin_toggle(self, name: str, active: bool) -> None:
+            # Recycled toggles replay ``active`` from their data; keep it current and
+            # ignore no-op flips.
+            plugin_list = self.root.ids.get("plugin_list")
+            if isinstance(plugin_list, RecycleView):
+                for entry in plugin_list.data:
+                    if entry["plugin_name"] == name:
+                        entry["active"] = active
+            if self.plugins.settings.is_plugin_enabled(name) == active:
+                return
             if active:
                 self.plugins.enable(name)
                 self.log_message(f"Plugin enabled: {name}")
@@ -412,20 +570,43 @@ if MDApp:  # pragma: no cover - executed only when GUI dependencies installed
             self.record_trace("on_plugin_toggle", metadata={"plugin": name, "active": active})
 
         def run_plugin(self, name: str) -> None:
-            try:
-                message = self.plugins.run_plugin(name, self)
-            except Exception as exc:  # pragma: no cover - plugin behaviour varies
+            self._run_in_background(
+                self.plugins.run_plugin,
+                name,
+                self,
+                on_done=lambda future: self._on_plugin_done(name, future),
+                git=True,
+            )
+
+        def _on_plugin_done(self, name: str, future: Future) -> None:
+            exc = future.exception()
+            if exc is not None:  # pragma: no cover - plugin behaviour varies
                 self.show_popup("Plugin Error", str(exc))
                 return
-            self.show_popup(name, message)
+            self.show_popup(name, future.result())
             self.log_message(f"Plugin executed: {name}")
             self.record_trace("run_plugin", metadata={"plugin": name})
 
         def run_code_break_analyzer(self) -> None:
+            if self._code_break_future is not None and not self._code_break_future.done():
+                self.show_popup("CodeBreakAnalyzer", "A bisect run is already in progress.")
+                return
+            self.root.ids.diagnostics_summary.text = "Running CodeBreakAnalyzer…"
+            self._code_break_future = self._run_in_background(
+                self._find_breaking_commit,
+                on_done=self._on_code_break_done,
+                git=True,
+            )
+
+        def _find_breaking_commit(self) -> str:
             try:
-                summary = self.plugins.run_plugin("CodeBreakAnalyzer", self)
+                return self.plugins.run_plugin("CodeBreakAnalyzer", self)
             except ValueError:
-                summary = self._run_bisect_direct()
+                return self._run_bisect_direct()
+
+        def _on_code_break_done(self, future: Future) -> None:
+            exc = future.exception()
+            summary = f"Diagnostics unavailable: {exc}" if exc is not None else future.result()
             self.root.ids.diagnostics_summary.text = summary
             self.log_message(summary)
             self.record_trace("run_code_break_analyzer", metadata={"summary_length": len(summary)})
@@ -441,35 +622,47 @@ if MDApp:  # pragma: no cover - executed only when GUI dependencies installed
         def display_diff_summary(self, summary: DiffSummary | None, error: str | None = None) -> None:
             summary_label = self.root.ids.get("analyzer_summary")
             detail_list = self.root.ids.get("analyzer_details")
-            if isinstance(detail_list, MDList):
-                detail_list.clear_widgets()
+            details: list[str] = []
 
             if error:
                 text = error
             elif summary:
                 lines = list(summary.as_lines())
                 text = lines[0] if lines else "No changes detected."
-                for extra in lines[1:]:
-                    if isinstance(detail_list, MDList):
-                        detail_list.add_widget(OneLineListItem(text=extra))
+                details = lines[1:]
             else:
                 text = "Run the diff analyzer to inspect recent changes."
 
+            if isinstance(detail_list, MDList):
+                self._fill_list(detail_list, details)
             if summary_label:
                 summary_label.text = text
 
         def run_diff_analyzer(self) -> None:
-            try:
-                diff_result = self.git.run_custom(["diff", "HEAD~1..HEAD"])
-            except GitCommandError as exc:
+            self._run_in_background(self._summarize_head_diff, on_done=self._on_diff_analyzed, git=True)
+
+        def _summarize_head_diff(self) -> DiffSummary | None:
+            """Summarize the last commit's diff, or return ``None`` if git printed nothing."""
+
+            lines = self.git.stream_custom(["diff", "HEAD~1..HEAD"])
+            # Binary- or mode-only commits print a diff without +/- lines, so
+            # emptiness is judged on git's output rather than on total_changes.
+            first = next(lines, None)
+            if first is None:
+                return None
+            return self.diff_analyzer.summarize_stream(itertools.chain((first,), lines))
+
+        def _on_diff_analyzed(self, future: Future) -> None:
+            exc = future.exception()
+            if exc is not None:
                 message = f"Diff unavailable: {exc}"
                 self.display_diff_summary(None, error=message)
                 self.log_message(message)
                 self.record_trace("run_diff_analyzer", metadata={"error": str(exc)})
                 return
 
-            diff_text = diff_result.stdout
-            if not diff_text.strip():
+            summary = future.result()
+            if summary is None:
                 message = "No changes between the last two commits."
                 self.display_diff_summary(None, error=message)
                 self.log_message(message)
@@ -477,7 +670,6 @@ if MDApp:  # pragma: no cover - executed only when GUI dependencies installed
                 self._latest_diff_summary = None
                 return
 
-            summary = self.diff_analyzer.summarize(diff_text)
             self._latest_diff_summary = summary
             self.display_diff_summary(summary)
             self.log_message(f"Analyzed diff with {summary.total_changes} changes.")
@@ -492,37 +684,37 @@ if MDApp:  # pragma: no cover - executed only when GUI dependencies installed
         def refresh_tracer_view(self) -> None:
             if not getattr(self, "root", None):
                 return
+            # Offscreen traces are rendered once, when the tracer screen is shown.
+            screen_manager = self.root.ids.get("screen_manager")
+            if screen_manager is not None and screen_manager.current != "tracer":
+                self._tracer_dirty = True
+                return
+            self._tracer_dirty = False
             call_list = self.root.ids.get("tracer_call_list")
             type_list = self.root.ids.get("tracer_type_list")
-            call_items = list(self.tracer.call_stack())
+            call_items = self.tracer.call_stack(limit=50)
             if isinstance(call_list, MDList):
-                call_list.clear_widgets()
-                if not call_items:
-                    call_list.add_widget(OneLineListItem(text="No trace events recorded yet."))
-                else:
-                    for event in call_items[-50:][::-1]:
-                        metadata = ", ".join(f"{key}={value}" for key, value in event.metadata.items())
-                        details = ", ".join(event.arg_types) or "no args"
-                        if event.kwarg_types:
-                            kw_details = ", ".join(f"{key}:{value}" for key, value in event.kwarg_types.items())
-                            details = f"{details} | kwargs: {kw_details}"
-                        text = f"{event.function} ({details})"
-                        if metadata:
-                            text = f"{text} [{metadata}]"
-                        call_list.add_widget(OneLineListItem(text=text))
+                call_texts = []
+                for event in reversed(call_items):
+                    args = ", ".join(event.arg_types) or "no args"
+                    kwargs = ", ".join(f"{key}:{value}" for key, value in event.kwarg_types.items())
+                    metadata = ", ".join(f"{key}={value}" for key, value in event.metadata.items())
+                    call_texts.append(
+                        f"{event.function} ({args}{f' | kwargs: {kwargs}' if kwargs else ''})"
+                        f"{f' [{metadata}]' if metadata else ''}"
+                    )
+                self._fill_list(call_list, call_texts or ["No trace events recorded yet."])
 
             type_usage = self.tracer.type_usage()
             if isinstance(type_list, MDList):
-                type_list.clear_widgets()
-                if not type_usage:
-                    type_list.add_widget(OneLineListItem(text="No nested type usage recorded."))
-                else:
-                    for type_name, values in sorted(type_usage.items()):
-                        unique_values = sorted(set(values))
-                        preview = ", ".join(unique_values[:5])
-                        if len(unique_values) > 5:
-                            preview += ", …"
-                        type_list.add_widget(OneLineListItem(text=f"{type_name}: {preview}"))
+                type_texts = []
+                for type_name, values in sorted(type_usage.items()):
+                    unique_values = sorted(set(values))
+                    preview = ", ".join(unique_values[:5])
+                    if len(unique_values) > 5:
+                        preview += ", …"
+                    type_texts.append(f"{type_name}: {preview}")
+                self._fill_list(type_list, type_texts or ["No nested type usage recorded."])
 
         def reset_traces(self) -> None:
             self.tracer.reset()
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import importlib.util
+import os
 import sys
 from pathlib import Path
 from types import ModuleType
@@ -15,6 +17,21 @@ from .utils.settings import SettingsManager
 
 __all__ = ["Plugin", "PluginManager", "PluginState"]
 
+_BASE_DIR = Path(__file__).resolve().parent
+_DEFAULT_SEARCH_PATHS: tuple[tuple[Path, str], ...] = (
+    (_BASE_DIR / "plugins", "git_helper.plugins"),
+)
+
+
+def _entry_mtime_ns(entry: os.DirEntry) -> int:
+    # Editing a package's __init__.py does not touch the package directory itself.
+    if entry.is_dir():
+        try:
+            return os.stat(os.path.join(entry.path, "__init__.py")).st_mtime_ns
+        except OSError:
+            pass
+    return entry.stat().st_mtime_ns
+
 
 @dataclass
 class PluginState:
@@ -29,55 +46,115 @@ class PluginManager:
                  settings: Optional[SettingsManager] = None) -> None:
         self.git = git_interface
         self.settings = settings or SettingsManager()
-        base_dir = Path(__file__).resolve().parent
-        self.search_paths: List[tuple[Path, str]] = [(base_dir / "plugins", "git_helper.plugins")]
+        self.search_paths: List[tuple[Path, str]] = list(_DEFAULT_SEARCH_PATHS)
         if search_paths:
             for index, path in enumerate(search_paths):
                 root = Path(path)
                 prefix = f"git_helper.dynamic_plugins.{index}"
                 self.search_paths.append((root, prefix))
         self._loaded: List[PluginState] | None = None
+        self._fingerprint: tuple | None = None
+        self._module_mtimes: dict[str, int] = {}
 
     # ---------------------------------------------------------------- discovery
     def discover(self, *, force: bool = False) -> List[PluginState]:
         if self._loaded is not None and not force:
             return self._loaded
-        discovered: List[PluginState] = []
         disabled = set(self.settings.disabled_plugins())
-        for path, prefix in self.search_paths:
-            if not path.exists():
+        listing, candidates = self._scan_search_paths()
+        fingerprint = (listing, frozenset(disabled))
+        if self._loaded is not None and fingerprint == self._fingerprint:
+            return self._loaded
+        modules: List[ModuleType | None] = []
+        pending: List[tuple[int, str, str, int]] = []
+        for entry, prefix in candidates:
+            located = self._locate_plugin(entry, prefix)
+            if located is None:
+                continue
+            module = self._reuse_module(*located)
+            if module is None:
+                pending.append((len(modules), *located))
+            modules.append(module)
+        # Only modules that really need read/compile/exec are worth a thread; a
+        # pool would cost more than a lone import. Registration stays serial.
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(4, len(pending))) as executor:
+                fresh = list(executor.map(lambda item: self._exec_plugin(*item[1:]), pending))
+        else:
+            fresh = [self._exec_plugin(*item[1:]) for item in pending]
+        for (index, *_), module in zip(pending, fresh):
+            modules[index] = module
+        discovered: List[PluginState] = []
+        for module in modules:
+            if not module:
+                continue
+            register = getattr(module, "register", None)
+            if not callable(register):
                 continue
-            for entry in sorted(path.iterdir()):
-                if entry.name.startswith("__"):
-                    continue
-                module = self._import_plugin(entry, prefix)
-                if not module:
-                    continue
-                register = getattr(module, "register", None)
-                if not callable(register):
-                    continue
-                try:
-                    plugin = register()
-                except TypeError:
-                    plugin = register(self.git)
-                except Exception:
-                    continue
-                if not isinstance(plugin, Plugin):
-                    continue
-                discovered.append(PluginState(plugin=plugin, enabled=plugin.name not in disabled))
+            try:
+                plugin = register()
+            except TypeError:
+                plugin = register(self.git)
+            except Exception:
+                continue
+            if not isinstance(plugin, Plugin):
+                continue
+            discovered.append(PluginState(plugin=plugin, enabled=plugin.name not in disabled))
         discovered.sort(key=lambda state: state.plugin.name.lower())
         self._loaded = discovered
+        self._fingerprint = fingerprint
         return discovered
 
-    def _import_plugin(self, entry: Path, prefix: str) -> ModuleType | None:
-        if entry.is_dir() and (entry / "__init__.py").exists():
-            location = entry / "__init__.py"
-            module_name = f"{prefix}.{entry.name}"
-        elif entry.is_file() and entry.suffix == ".py":
-            location = entry
-            module_name = f"{prefix}.{entry.stem}"
+    def _scan_search_paths(self) -> tuple[tuple, List[tuple[os.DirEntry, str]]]:
+        """List every search path once, yielding a change fingerprint and import candidates."""
+
+        parts = []
+        candidates: List[tuple[os.DirEntry, str]] = []
+        for path, prefix in self.search_paths:
+            try:
+                with os.scandir(path) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except OSError:
+                parts.append((str(path), None))
+                continue
+            # __pycache__ and friends change as a side effect of importing, so only
+            # the entries that become import candidates feed the fingerprint.
+            entries = [entry for entry in entries if not entry.name.startswith("__")]
+            parts.append((str(path), tuple((entry.name, _entry_mtime_ns(entry)) for entry in entries)))
+            candidates.extend((entry, prefix) for entry in entries)
+        return tuple(parts), candidates
+
+    def _locate_plugin(self, entry: os.DirEntry, prefix: str) -> tuple[str, str, int] | None:
+        """Return ``(module_name, location, mtime_ns)`` for an importable entry."""
+
+        name = entry.name
+        if entry.is_dir():
+            location = os.path.join(entry.path, "__init__.py")
+            module_name = f"{prefix}.{name}"
+        elif entry.is_file() and name.endswith(".py"):
+            location = entry.path
+            module_name = f"{prefix}.{name[:-3]}"
         else:
             return None
+        try:
+            # Also rejects package directories without an __init__.py.
+            return module_name, location, os.stat(location).st_mtime_ns
+        except OSError:
+            return None
+
+    def _reuse_module(self, module_name: str, location: str, mtime: int) -> ModuleType | None:
+        # Re-executing an unchanged module is wasted work, and for modules other
+        # code already imported (e.g. plugins.base) it would swap out their classes.
+        module = sys.modules.get(module_name)
+        if (
+            module is not None
+            and getattr(module, "__file__", None) == location
+            and self._module_mtimes.setdefault(module_name, mtime) == mtime
+        ):
+            return module
+        return None
+
+    def _exec_plugin(self, module_name: str, location: str, mtime: int) -> ModuleType | None:
         try:
             spec = importlib.util.spec_from_file_location(module_name, location)
             if not spec or not spec.loader:
@@ -85,18 +162,22 @@ class PluginManager:
             module = importlib.util.module_from_spec(spec)
             sys.modules[module_name] = module
             spec.loader.exec_module(module)
-            return module
         except Exception:
+            sys.modules.pop(module_name, None)
             return None
+        self._module_mtimes[module_name] = mtime
+        return module
 
     # ----------------------------------------------------------------- settings
     def enable(self, plugin_name: str) -> None:
         self.settings.enable_plugin(plugin_name)
         self._loaded = None
+        self._fingerprint = None
 
     def disable(self, plugin_name: str) -> None:
         self.settings.disable_plugin(plugin_name)
         self._loaded = None
+        self._fingerprint = None
 
     def get_enabled_plugins(self) -> List[Plugin]:
         return [state.plugin for state in self.discover() if state.enabled]
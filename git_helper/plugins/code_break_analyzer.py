@@ -10,14 +10,23 @@ from ..diagnostics import DiagnosticEngine
 
 __all__ = ["register"]
 
+# DiagnosticEngine.find_breaking_commit reports "<sha> identified as the first bad commit."
+_BAD_COMMIT_MARKER = " identified as the first bad commit."
+
 
 def register(git=None) -> Plugin:
+    # Each engine holds its git interface, so an id() key cannot be recycled
+    # while the entry is alive.
+    engines: dict[int, DiagnosticEngine] = {}
+
     def run(git_interface, app: Any) -> str:
-        engine = DiagnosticEngine(git_interface)
+        engine = engines.get(id(git_interface))
+        if engine is None:
+            engine = engines[id(git_interface)] = DiagnosticEngine(git_interface)
         summary = engine.find_breaking_commit()
         commit = None
-        if "identified as the first bad commit" in summary:
-            commit = summary.split()[0]
+        if summary.endswith(_BAD_COMMIT_MARKER):
+            commit = summary[: -len(_BAD_COMMIT_MARKER)]
         if commit:
             report = engine.generate_report(commit, summary)
             message = f"🚨 CodeBreakAnalyzer\n{summary}\nReport: {report}"
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+from collections import OrderedDict
 from typing import Any
 
 from .base import Plugin
@@ -12,6 +14,11 @@ from ..diagnostics.query_engine import QueryEngine
 
 __all__ = ["register"]
 
+_SUMMARY_CACHE_SIZE = 64
+# Reused across plug-in runs: (api key, client) and blake2b(diff excerpt) -> summary.
+_CLIENT: tuple[str, Any] | None = None
+_SUMMARY_CACHE: OrderedDict[bytes, str] = OrderedDict()
+
 
 def _prompt(app: Any, message: str) -> str:
     if app is None:
@@ -28,28 +35,47 @@ def _notify(app: Any, title: str, body: str) -> None:
         popup(title, body)
 
 
+def _openai_client(api_key: str) -> Any:
+    global _CLIENT
+    if _CLIENT is None or _CLIENT[0] != api_key:
+        from openai import OpenAI  # type: ignore
+
+        _CLIENT = (api_key, OpenAI(api_key=api_key))
+    return _CLIENT[1]
+
+
 def _ai_summary(diff_text: str) -> str | None:
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         return None
+    excerpt = diff_text[:4000]
+    digest = hashlib.blake2b(excerpt.encode("utf-8"), digest_size=16).digest()
+    cached = _SUMMARY_CACHE.get(digest)
+    if cached is not None:
+        _SUMMARY_CACHE.move_to_end(digest)
+        return cached
     try:
-        from openai import OpenAI  # type: ignore
+        client = _openai_client(api_key)
     except Exception:  # pragma: no cover - optional dependency
         return None
     try:
-        client = OpenAI(api_key=api_key)
         completion = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {
                     "role": "user",
-                    "content": f"Summarize the following git diff in concise bullet points:\n{diff_text[:4000]}",
+                    "content": f"Summarize the following git diff in concise bullet points:\n{excerpt}",
                 }
             ],
         )
-        return completion.choices[0].message.content or None
+        summary = completion.choices[0].message.content or None
     except Exception:  # pragma: no cover - external service errors
         return None
+    if summary:
+        _SUMMARY_CACHE[digest] = summary
+        if len(_SUMMARY_CACHE) > _SUMMARY_CACHE_SIZE:
+            _SUMMARY_CACHE.popitem(last=False)
+    return summary
 
 
 def register(git=None) -> Plugin:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -37,10 +38,11 @@ class SSHTools:
         if not directory.exists():
             return []
         keys: list[Path] = []
-        for entry in directory.glob("id_*"):
-            if entry.suffix == ".pub":
-                continue
-            if entry.is_file():
-                keys.append(entry)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.startswith("id_") or entry.name.endswith(".pub"):
+                    continue
+                if entry.is_file():
+                    keys.append(Path(entry.path))
         return sorted(keys)
 
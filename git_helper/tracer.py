@@ -2,38 +2,59 @@
 
 from __future__ import annotations
 
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
 
+# Shared, read-only metadata for the common call without any.
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass(frozen=True)
+# Marks the end of a container's children on the walker stack; the container's
+# id sits directly beneath it.
+_EXIT = object()
+
+# Seed for the per-tracer type -> name cache so common argument types never
+# need a __name__ lookup.
+_TYPE_NAMES: Dict[type, str] = {
+    cls: cls.__name__ for cls in (int, str, bytes, float, bool, list, tuple, dict, set, type(None))
+}
+
+
+@dataclass(frozen=True, slots=True)
 class TraceEvent:
     """Immutable description of a traced function call."""
 
     function: str
     arg_types: List[str]
     kwarg_types: Dict[str, str]
-    metadata: Dict[str, Any]
+    metadata: Mapping[str, Any]
 
 
 class FunctionTracer:
     """Collects lightweight runtime traces for GUI presentation."""
 
     def __init__(self) -> None:
-        self._call_stack: List[TraceEvent] = []
+        # Calls are stored column-wise; TraceEvent objects are only built on read.
+        self._functions: List[str] = []
+        self._arg_types: List[Tuple[str, ...]] = []
+        self._kwarg_types: List[Tuple[Tuple[str, str], ...]] = []
+        self._metadata: List[Mapping[str, Any]] = []
         self._type_history: Dict[str, List[str]] = defaultdict(list)
+        self._type_names: Dict[type, str] = dict(_TYPE_NAMES)
 
     def trace_function(self, func_name: str, *args: Any, metadata: Dict[str, Any] | None = None, **kwargs: Any) -> None:
         """Record a function invocation with basic argument type information."""
 
-        event = TraceEvent(
-            function=func_name,
-            arg_types=[type(arg).__name__ for arg in args],
-            kwarg_types={key: type(value).__name__ for key, value in kwargs.items()},
-            metadata=dict(metadata or {}),
+        # The same few handler names are traced over and over; share one string each.
+        self._functions.append(sys.intern(func_name))
+        name_of = self._type_names.get
+        self._arg_types.append(tuple([name_of(type(arg)) or type(arg).__name__ for arg in args]))
+        self._kwarg_types.append(
+            tuple([(key, name_of(type(value)) or type(value).__name__) for key, value in kwargs.items()])
         )
-        self._call_stack.append(event)
+        self._metadata.append(dict(metadata) if metadata else _EMPTY_METADATA)
 
         for arg in args:
             self._track_nested_types(arg)
@@ -41,20 +62,61 @@ class FunctionTracer:
             self._track_nested_types(value)
 
     def _track_nested_types(self, obj: Any) -> None:
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                self._type_history[type(key).__name__].append(str(key))
-                self._track_nested_types(value)
-        elif isinstance(obj, (list, tuple, set)):
-            for item in obj:
-                self._track_nested_types(item)
-        else:
-            self._type_history[type(obj).__name__].append(str(obj))
-
-    def call_stack(self) -> Iterable[TraceEvent]:
-        """Return the chronological call stack."""
-
-        return list(self._call_stack)
+        # Explicit stack instead of recursion: no frame per element and no
+        # RecursionError on deeply nested arguments. Only containers on the
+        # current path are tracked, so self-references stop the walk while
+        # shared (but acyclic) sub-containers are still counted every time.
+        history = self._type_history
+        names = self._type_names
+        # Neighbouring values usually share a type, so keep the last type's
+        # history list at hand instead of resolving it for every element.
+        last_cls: type | None = None
+        values: List[str] = []
+        ancestors: set[int] = set()
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            if current is _EXIT:
+                ancestors.discard(stack.pop())
+                continue
+            if isinstance(current, (dict, list, tuple, set)):
+                if id(current) in ancestors:
+                    continue
+                ancestors.add(id(current))
+                stack.append(id(current))
+                stack.append(_EXIT)
+            if isinstance(current, dict):
+                for key in current:
+                    cls = type(key)
+                    if cls is not last_cls:
+                        last_cls = cls
+                        values = history[names.get(cls) or names.setdefault(cls, cls.__name__)]
+                    values.append(str(key))
+                stack.extend(reversed(current.values()))
+            elif isinstance(current, (list, tuple)):
+                stack.extend(reversed(current))
+            elif isinstance(current, set):
+                stack.extend(current)
+            else:
+                cls = type(current)
+                if cls is not last_cls:
+                    last_cls = cls
+                    values = history[names.get(cls) or names.setdefault(cls, cls.__name__)]
+                values.append(str(current))
+
+    def call_stack(self, limit: int | None = None) -> Iterable[TraceEvent]:
+        """Return the chronological call stack, optionally only the last ``limit`` calls."""
+
+        start = 0 if limit is None else max(len(self._functions) - limit, 0)
+        return [
+            TraceEvent(function=function, arg_types=list(arg_types), kwarg_types=dict(kwarg_types), metadata=metadata)
+            for function, arg_types, kwarg_types, metadata in zip(
+                self._functions[start:],
+                self._arg_types[start:],
+                self._kwarg_types[start:],
+                self._metadata[start:],
+            )
+        ]
 
     def type_usage(self) -> Dict[str, List[str]]:
         """Return collected nested type information."""
@@ -64,7 +126,10 @@ class FunctionTracer:
     def reset(self) -> None:
         """Clear all tracked data."""
 
-        self._call_stack.clear()
+        self._functions.clear()
+        self._arg_types.clear()
+        self._kwarg_types.clear()
+        self._metadata.clear()
         self._type_history.clear()
 
 
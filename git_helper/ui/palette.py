@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Mapping, Optional
+from typing import Iterable, Iterator, Mapping, Optional
 
 from prompt_toolkit import prompt
-from prompt_toolkit.completion import FuzzyWordCompleter
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion, FuzzyWordCompleter
+from prompt_toolkit.document import Document
 from prompt_toolkit.styles import Style
 
-__all__ = ["CommandPalette", "PaletteCommand"]
+__all__ = ["CommandPalette", "PaletteCommand", "TrieCompleter"]
+
+# Trie nodes map single characters to child nodes; this key holds the word ending there.
+_END = "$end"
 
 
 @dataclass(frozen=True)
@@ -20,12 +24,62 @@ class PaletteCommand:
     description: str
 
 
+class TrieCompleter(Completer):
+    """Prefix completer over a fixed word list, falling back to fuzzy matching.
+
+    Lookup walks one trie node per typed character, so the cost per keystroke
+    does not grow with the number of commands.
+    """
+
+    def __init__(self, words: Iterable[str], max_results: int = 50) -> None:
+        words = list(words)
+        self._root: dict = {}
+        for word in words:
+            node = self._root
+            for char in word:
+                node = node.setdefault(char, {})
+            node[_END] = word
+        self._max_results = max_results
+        self._fuzzy = FuzzyWordCompleter(words, WORD=True)
+
+    def prefix_matches(self, prefix: str) -> list[str]:
+        """Return up to ``max_results`` words starting with ``prefix`` in sorted order."""
+
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        matches: list[str] = []
+        stack = [node]
+        while stack and len(matches) < self._max_results:
+            node = stack.pop()
+            if _END in node:
+                matches.append(node[_END])
+            stack.extend(node[char] for char in sorted(node, reverse=True) if char != _END)
+        return matches
+
+    def get_completions(self, document: Document, complete_event: CompleteEvent) -> Iterator[Completion]:
+        text = document.text_before_cursor.lstrip()
+        matches = self.prefix_matches(text)
+        if not matches:
+            yield from self._fuzzy.get_completions(document, complete_event)
+            return
+        for word in matches:
+            yield Completion(word, start_position=-len(text))
+
+
 class CommandPalette:
-    """Simple fuzzy-search command palette for the CLI."""
+    """Simple prefix/fuzzy-search command palette for the CLI."""
 
     def __init__(self, commands: Mapping[str, PaletteCommand]) -> None:
         self._commands = dict(commands)
-        self._completer = FuzzyWordCompleter(list(self._commands.keys()), WORD=True)
+        self._completer = TrieCompleter(list(self._commands.keys()))
+        # Commands are fixed at construction, so the help text never changes.
+        self._help_text = "\n".join(
+            ["Available palette commands:"]
+            + [f"- {command.name}: {command.description}" for command in self._commands.values()]
+        )
         self._style = Style.from_dict({
             "prompt": "bold cyan",
             "completion-menu.completion": "bg:#202630 #f0f6fc",
@@ -52,7 +106,4 @@ class CommandPalette:
     def format_help(self) -> str:
         """Return formatted help text for palette commands."""
 
-        lines = ["Available palette commands:"]
-        for command in self._commands.values():
-            lines.append(f"- {command.name}: {command.description}")
-        return "\n".join(lines)
+        return self._help_text
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Mapping
+
+try:  # pragma: no cover - optional Rust-backed parser/serializer
+    import rtoml
+except ModuleNotFoundError:  # pragma: no cover
+    rtoml = None  # type: ignore
 
 try:  # pragma: no cover
     import tomllib
@@ -17,6 +24,8 @@ try:  # pragma: no cover
 except ModuleNotFoundError:  # pragma: no cover
     tomli_w = None  # type: ignore
 
+_toml_loads = rtoml.loads if rtoml else tomllib.loads
+
 CONFIG_DIR = Path(os.environ.get("GITHELPER_CONFIG_DIR", Path.home() / ".config" / "githelper"))
 CONFIG_FILE = CONFIG_DIR / "config.toml"
 
@@ -48,12 +57,19 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 }
 
 
+def _default_config() -> Dict[str, Any]:
+    # Deep copy: the nested sections/lists must never alias the module defaults.
+    return copy.deepcopy(DEFAULT_CONFIG)
+
+
 @dataclass
 class ConfigManager:
     """Load and persist gitHelper configuration in TOML."""
 
     path: Path = field(default_factory=_default_config_path)
-    data: Dict[str, Any] = field(default_factory=lambda: DEFAULT_CONFIG.copy())
+    data: Dict[str, Any] = field(default_factory=_default_config)
+    # Digest, mtime and size of the last write; a save is skipped only while all three match.
+    _saved_state: tuple[bytes, int, int] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.path = Path(self.path)
@@ -65,12 +81,12 @@ class ConfigManager:
 
         if not self.path.exists():
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            self.data = DEFAULT_CONFIG.copy()
+            self.data = _default_config()
             self.save()
             return
-        with self.path.open("rb") as fh:
-            loaded = tomllib.load(fh)
-        merged = DEFAULT_CONFIG.copy()
+        loaded = _toml_loads(self.path.read_text(encoding="utf-8"))
+        self._saved_state = None
+        merged = _default_config()
         for key, value in loaded.items():
             merged[key] = value
         self.data = merged
@@ -78,13 +94,28 @@ class ConfigManager:
     def save(self) -> None:
         """Persist configuration to disk."""
 
+        payload = self._serialize()
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if self._saved_state is not None and self._saved_state[0] == digest:
+            try:
+                stat = self.path.stat()
+            except OSError:
+                pass
+            else:
+                # An external edit changes mtime or size, so it still gets overwritten.
+                if (stat.st_mtime_ns, stat.st_size) == self._saved_state[1:]:
+                    return
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        if tomli_w:
-            with self.path.open("wb") as fh:  # pragma: no branch - depends on dependency
-                tomli_w.dump(self.data, fh)
-        else:  # pragma: no cover - fallback path
-            content = _dump_toml(self.data)
-            self.path.write_text(content, encoding="utf-8")
+        self.path.write_bytes(payload)
+        stat = self.path.stat()
+        self._saved_state = (digest, stat.st_mtime_ns, stat.st_size)
+
+    def _serialize(self) -> bytes:
+        if rtoml:  # pragma: no cover - optional dependency
+            return rtoml.dumps(self.data).encode("utf-8")
+        if tomli_w:  # pragma: no branch - depends on dependency
+            return tomli_w.dumps(self.data).encode("utf-8")
+        return _dump_toml(self.data).encode("utf-8")  # pragma: no cover - fallback path
 
     # ----------------------------------------------------------------- convenience
     def get(self, section: str, key: str, default: Any | None = None) -> Any:
@@ -94,6 +125,13 @@ class ConfigManager:
         self.data.setdefault(section, {})[key] = value
         self.save()
 
+    def set_many(self, updates: Mapping[str, Mapping[str, Any]]) -> None:
+        """Apply ``{section: {key: value}}`` updates and save once."""
+
+        for section, values in updates.items():
+            self.data.setdefault(section, {}).update(values)
+        self.save()
+
     def profile_summary(self) -> str:
         github = self.data.get("github", {})
         workspace = self.data.get("workspace", {})
@@ -117,22 +155,32 @@ class ConfigManager:
         return "\n".join(lines)
 
 
+def _format_list(value: list) -> str:
+    return "[" + ", ".join([_format_value(item) for item in value]) + "]"
+
+
+# Exact-type dispatch; bool precedes int so the subclass fallback below keeps that order.
+_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    bool: lambda value: "true" if value else "false",
+    int: str,
+    float: str,
+    list: _format_list,
+    str: lambda value: f'"{value}"',
+}
+
+
 def _format_value(value: Any) -> str:
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    if isinstance(value, (int, float)):
-        return str(value)
-    if isinstance(value, list):
-        formatted = ", ".join(_format_value(item) for item in value)
-        return f"[{formatted}]"
-    return f'"{value}"'
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is None:
+        formatter = next((fn for cls, fn in _FORMATTERS.items() if isinstance(value, cls)), None)
+        if formatter is None:
+            return f'"{value}"'
+    return formatter(value)
 
 
 def _dump_toml(data: Dict[str, Any]) -> str:
-    lines: list[str] = []
-    for section, values in data.items():
-        lines.append(f"[{section}]")
-        for key, value in values.items():
-            lines.append(f"{key} = {_format_value(value)}")
-        lines.append("")
-    return "\n".join(lines).rstrip() + "\n"
+    sections = [
+        "\n".join([f"[{section}]", *[f"{key} = {_format_value(value)}" for key, value in values.items()]])
+        for section, values in data.items()
+    ]
+    return "\n\n".join(sections) + "\n"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -16,7 +17,9 @@ LOG_DIR = Path.home() / ".githelper" / "logs"
 __all__ = ["configure_logging", "get_logger", "LOG_DIR"]
 
 
+@functools.lru_cache(maxsize=1)
 def _log_file() -> Path:
+    # One log file per process, however often logging is (re)configured.
     LOG_DIR.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
     return LOG_DIR / f"githelper-{timestamp}.log"
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import copy
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Iterable
 
+try:  # pragma: no cover - optional C-backed JSON codec
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 SETTINGS_DIR = Path.home() / ".config" / "git_helper"
 SETTINGS_FILE = SETTINGS_DIR / "settings.json"
 DEFAULT_SETTINGS: Dict[str, Any] = {
@@ -18,12 +24,29 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
 __all__ = ["SettingsManager", "SETTINGS_FILE", "DEFAULT_SETTINGS"]
 
 
+def _dumps(data: Dict[str, Any]) -> bytes:
+    if orjson:  # pragma: no branch - depends on dependency
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")  # pragma: no cover - fallback path
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both.
+_loads = orjson.loads if orjson else json.loads
+
+
+def _default_settings() -> Dict[str, Any]:
+    # Deep copy: the nested sections/lists must never alias the module defaults.
+    return copy.deepcopy(DEFAULT_SETTINGS)
+
+
 @dataclass
 class SettingsManager:
     """Load and persist GUI-specific preferences."""
 
     path: Path = field(default=SETTINGS_FILE)
-    data: Dict[str, Any] = field(default_factory=lambda: DEFAULT_SETTINGS.copy())
+    data: Dict[str, Any] = field(default_factory=_default_settings)
+    # Canonical in-memory form of data["disabled_plugins"]; the list is only for disk.
+    _disabled: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.path = Path(self.path)
@@ -31,50 +54,53 @@ class SettingsManager:
 
     def reload(self) -> None:
         if not self.path.exists():
+            self._disabled = set(self.data.get("disabled_plugins", []))
             self.save()
             return
         try:
-            loaded = json.loads(self.path.read_text(encoding="utf-8"))
+            loaded = _loads(self.path.read_bytes())
         except json.JSONDecodeError:
-            self.data = DEFAULT_SETTINGS.copy()
+            self.data = _default_settings()
+            self._disabled = set(self.data["disabled_plugins"])
             self.save()
             return
-        merged = DEFAULT_SETTINGS.copy()
+        merged = _default_settings()
         if isinstance(loaded, dict):
             merged.update(loaded)
         merged.setdefault("disabled_plugins", [])
         self.data = merged
+        self._disabled = set(merged["disabled_plugins"])
 
     def save(self) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        content = json.dumps(self.data, indent=2, sort_keys=True)
-        self.path.write_text(content, encoding="utf-8")
+        self.path.write_bytes(_dumps(self.data))
 
     # ---------------------------------------------------------------- utilities
     def get(self, key: str, default: Any | None = None) -> Any:
         return self.data.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
+        if key == "disabled_plugins":
+            self._disabled = set(value)
         self.data[key] = value
         self.save()
 
     def disable_plugin(self, name: str) -> None:
-        disabled = set(self.data.get("disabled_plugins", []))
-        disabled.add(name)
-        self.data["disabled_plugins"] = sorted(disabled)
-        self.save()
+        if name not in self._disabled:
+            self._disabled.add(name)
+            self._sync_and_save()
 
     def enable_plugin(self, name: str) -> None:
-        disabled = set(self.data.get("disabled_plugins", []))
-        if name in disabled:
-            disabled.remove(name)
-            self.data["disabled_plugins"] = sorted(disabled)
-            self.save()
+        if name in self._disabled:
+            self._disabled.discard(name)
+            self._sync_and_save()
 
     def is_plugin_enabled(self, name: str) -> bool:
-        disabled = set(self.data.get("disabled_plugins", []))
-        return name not in disabled
+        return name not in self._disabled
 
     def disabled_plugins(self) -> Iterable[str]:
         return tuple(self.data.get("disabled_plugins", []))
 
+    def _sync_and_save(self) -> None:
+        self.data["disabled_plugins"] = sorted(self._disabled)
+        self.save()
@@ -63,13 +63,11 @@ class TokenManager:
         if not token:
             raise TokenManagerError("No GitHub token is available. Run 'git-helper onboard' to configure one.")
         if scopes:
-            available = set()
-            if scope_provider:
-                available.update(scope_provider())
-            missing = [scope for scope in scopes if scope not in available]
+            available = set(scope_provider()) if scope_provider else set()
+            missing = set(scopes).difference(available)
             if missing:
                 raise TokenManagerError(
-                    "GitHub token is missing required scopes: " + ", ".join(missing)
+                    "GitHub token is missing required scopes: " + ", ".join(sorted(missing))
                 )
         return token
 
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import atexit
 import json
-from dataclasses import dataclass
-from typing import Optional
-from urllib.error import URLError
+import os
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+from .config import CONFIG_DIR
+
 GITHUB_REPO = "cahirsch/gitHelper"
 API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+# The releases endpoint is asked at most once per day; the cached answer serves the rest.
+UPDATE_CHECK_TTL = 24 * 60 * 60
+# How long interpreter exit waits for an unfinished background check to write its cache.
+UPDATE_CHECK_EXIT_WAIT = 1.0
 
-__all__ = ["ReleaseInfo", "check_for_update"]
+__all__ = ["ReleaseInfo", "check_for_update", "start_update_check_async"]
 
 
 @dataclass
@@ -21,25 +33,84 @@ class ReleaseInfo:
     body: str
 
 
-def _fetch_latest_release() -> Optional[ReleaseInfo]:
-    request = Request(API_URL, headers={"Accept": "application/vnd.github+json"})
+def _cache_file() -> Path:
+    override = os.environ.get("GITHELPER_CONFIG_DIR")
+    return (Path(override) if override else CONFIG_DIR) / "update-cache.json"
+
+
+def _read_cache() -> Dict[str, Any]:
+    try:
+        cache = json.loads(_cache_file().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache(cache: Dict[str, Any]) -> None:
+    path = _cache_file()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent invocations never read a partial file.
+        partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        partial.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(partial, path)
+    except OSError:  # pragma: no cover - read-only home directories
+        pass
+
+
+def _fetch_latest_release(cached: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Query the Releases API and return a new cache record, or ``None`` on failure.
+
+    The stored ETag is sent as ``If-None-Match`` so an unchanged release costs
+    a bodyless 304 instead of the full payload.
+    """
+
+    headers = {"Accept": "application/vnd.github+json"}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    request = Request(API_URL, headers=headers)
     try:
         with urlopen(request, timeout=5) as response:
             payload = json.loads(response.read().decode("utf-8"))
+            etag = response.headers.get("ETag")
+    except HTTPError as exc:  # pragma: no cover - network dependent
+        if exc.code != 304:
+            return None
+        return {**cached, "checked_at": time.time()}
     except (URLError, TimeoutError, json.JSONDecodeError):  # pragma: no cover - network dependent
         return None
     tag = payload.get("tag_name")
     url = payload.get("html_url")
     body = payload.get("body", "")
-    if not (tag and url):
+    release = ReleaseInfo(tag_name=tag, html_url=url, body=body) if tag and url else None
+    return {
+        "checked_at": time.time(),
+        "etag": etag,
+        "release": asdict(release) if release else None,
+    }
+
+
+def _latest_release() -> Optional[ReleaseInfo]:
+    cache = _read_cache()
+    checked_at = cache.get("checked_at")
+    if not isinstance(checked_at, (int, float)) or time.time() - checked_at >= UPDATE_CHECK_TTL:
+        fresh = _fetch_latest_release(cache)
+        if fresh is not None:
+            _write_cache(fresh)
+            cache = fresh
+    release = cache.get("release")
+    if not isinstance(release, dict):
+        return None
+    try:
+        return ReleaseInfo(**release)
+    except TypeError:
         return None
-    return ReleaseInfo(tag_name=tag, html_url=url, body=body)
 
 
 def check_for_update(current_version: str) -> Optional[ReleaseInfo]:
     """Return release info when a newer version is available."""
 
-    latest = _fetch_latest_release()
+    latest = _latest_release()
     if not latest:
         return None
     def normalize(tag: str) -> str:
@@ -48,3 +119,26 @@ def check_for_update(current_version: str) -> Optional[ReleaseInfo]:
         return None
     return latest
 
+
+def start_update_check_async(current_version: str) -> Future:
+    """Run :func:`check_for_update` on a daemon thread and return its future.
+
+    Interpreter exit waits up to ``UPDATE_CHECK_EXIT_WAIT`` seconds for the
+    check so quick commands still get the cache written; a check that is
+    slower than that is abandoned and the next invocation tries again.
+    """
+
+    future: Future = Future()
+
+    def worker() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(check_for_update(current_version))
+        except BaseException as exc:  # pragma: no cover - defensive
+            future.set_exception(exc)
+
+    thread = threading.Thread(target=worker, name="githelper-update-check", daemon=True)
+    thread.start()
+    atexit.register(thread.join, UPDATE_CHECK_EXIT_WAIT)
+    return future
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from git_helper.analyzer import DiffAnalyzer
+
+DIFF = """diff --git a/app.py b/app.py
+index 1111111..2222222 100644
+--- a/app.py
++++ b/app.py
+@@ -1,4 +1,5 @@
+ import os
+-import sys
++import sys  # noqa
++import json
+ 
+ def main():
+@@ -20,3 +21,3 @@ def main():
+-    return 0
++    return 1
+     # trailing
+diff --git a/README.md b/README.md
+index 3333333..4444444 100644
+--- a/README.md
++++ b/README.md
+@@ -1,2 +1,2 @@
+-Hello
++Hello
++    return 1
+ World
+"""
+
+
+def test_summarize_stream_matches_summarize():
+    analyzer = DiffAnalyzer()
+    expected = analyzer.summarize(DIFF)
+    streamed = analyzer.summarize_stream(line + "\n" for line in DIFF.splitlines())
+    assert streamed == expected
+    assert expected.total_changes == 8
+    assert expected.additions == {"import sys  # noqa": 1, "import json": 1, "return 1": 2, "Hello": 1}
+    assert expected.deletions == {"import sys": 1, "return 0": 1, "Hello": 1}
+
+
+def test_summarize_ignores_file_headers_outside_hunks():
+    summary = DiffAnalyzer().summarize("--- a/x\n+++ b/x\n")
+    assert summary.total_changes == 0
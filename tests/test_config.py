@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from git_helper.utils.config import ConfigManager
 
 
@@ -18,3 +20,43 @@ def test_config_manager_creates_defaults(tmp_path):
     summary = manager.profile_summary()
     assert "octo-org" in summary
     assert "dark" in summary
+
+
+def test_config_manager_skips_unchanged_writes(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.toml"
+    manager = ConfigManager(path=config_file)
+    manager.set("ui", "theme", "dark")
+    written = config_file.read_text(encoding="utf-8")
+
+    writes = []
+    original_write_bytes = Path.write_bytes
+
+    def counting_write_bytes(self, data):
+        writes.append(self)
+        return original_write_bytes(self, data)
+
+    monkeypatch.setattr(Path, "write_bytes", counting_write_bytes)
+    manager.set("ui", "theme", "dark")
+    assert writes == []
+
+    # A file edited behind the manager's back is rewritten even if memory is unchanged.
+    config_file.write_text(written + "\n", encoding="utf-8")
+    manager.set("ui", "theme", "dark")
+    assert writes == [config_file]
+    assert config_file.read_text(encoding="utf-8") == written
+
+    manager.set_many({"ui": {"theme": "light", "use_gui": True}, "github": {"default_org": "octo-org"}})
+    manager.reload()
+    assert manager.get("ui", "theme") == "light"
+    assert manager.get("ui", "use_gui") is True
+    assert manager.get("github", "default_org") == "octo-org"
+
+
+def test_config_manager_does_not_mutate_defaults(tmp_path):
+    manager = ConfigManager(path=tmp_path / "config.toml")
+    manager.set("github", "default_org", "octo-org")
+    manager.data["github"]["preferred_repos"].append("octo-org/repo")
+
+    fresh = ConfigManager(path=tmp_path / "other.toml")
+    assert fresh.get("github", "default_org") == ""
+    assert fresh.get("github", "preferred_repos") == []
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from git_helper.git_core import GitCommandError, GitCore
+
+
+def run_git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def init_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    run_git(repo, "init")
+    run_git(repo, "config", "user.name", "Tester")
+    run_git(repo, "config", "user.email", "tester@example.com")
+    return repo
+
+
+def commit_file(repo: Path, name: str, content: str, message: str) -> None:
+    (repo / name).write_text(content)
+    run_git(repo, "add", name)
+    run_git(repo, "commit", "-m", message)
+
+
+def test_stream_custom_yields_diff_lines(tmp_path):
+    repo = init_repo(tmp_path)
+    commit_file(repo, "notes.txt", "one\n", "first")
+    commit_file(repo, "notes.txt", "one\ntwo\n", "second")
+
+    lines = list(GitCore(repo).stream_custom(["diff", "HEAD~1..HEAD"]))
+    assert lines[0].startswith("diff --git a/notes.txt b/notes.txt")
+    assert "+two\n" in lines
+    assert lines == GitCore(repo).run_custom(["diff", "HEAD~1..HEAD"]).stdout.splitlines(keepends=True)
+
+
+def test_stream_custom_raises_with_git_stderr(tmp_path):
+    repo = init_repo(tmp_path)
+    with pytest.raises(GitCommandError, match="unknown revision"):
+        list(GitCore(repo).stream_custom(["diff", "HEAD~1..HEAD"]))
+
+
+def test_stream_survives_stderr_larger_than_a_pipe_buffer(tmp_path):
+    repo = init_repo(tmp_path)
+    noisy = "!f() { head -c 200000 /dev/zero | tr '\\0' x >&2; echo done; exit 3; }; f"
+    stream = GitCore(repo)._stream("-c", f"alias.noisy={noisy}", "noisy")
+    lines = []
+    with pytest.raises(GitCommandError) as excinfo:
+        for line in stream:
+            lines.append(line)
+    assert lines == ["done\n"]
+    assert len(str(excinfo.value)) == 200000
+
+
+
+def test_log_iter_yields_entries_newest_first(tmp_path):
+    repo = init_repo(tmp_path)
+    for index in range(3):
+        commit_file(repo, "notes.txt", f"{index}\n", f"commit {index}")
+
+    entries = list(GitCore(repo).log_iter(limit=2))
+    assert [entry.split(" ", 1)[1] for entry in entries] == ["commit 2", "commit 1"]
+    assert all(not entry.endswith("\n") for entry in entries)
+
+
+def test_log_iter_is_empty_without_commits(tmp_path):
+    repo = init_repo(tmp_path)
+    assert list(GitCore(repo).log_iter()) == []
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from git_helper.ui.palette import TrieCompleter
+
+
+def _complete(completer: TrieCompleter, text: str) -> list[str]:
+    return [completion.text for completion in completer.get_completions(Document(text), CompleteEvent())]
+
+
+def test_trie_completer_prefers_prefix_matches():
+    completer = TrieCompleter(["status", "scan", "switch", "diff-ai", "devlog"])
+    assert _complete(completer, "s") == ["scan", "status", "switch"]
+    assert _complete(completer, "sta") == ["status"]
+    assert _complete(completer, "") == ["devlog", "diff-ai", "scan", "status", "switch"]
+
+
+def test_trie_completer_falls_back_to_fuzzy_matching():
+    completer = TrieCompleter(["status", "diff-ai", "devlog"])
+    assert _complete(completer, "dai") == ["diff-ai"]
+
+
+def test_trie_completer_caps_results():
+    completer = TrieCompleter([f"cmd{index:02d}" for index in range(10)], max_results=3)
+    assert _complete(completer, "cmd") == ["cmd00", "cmd01", "cmd02"]
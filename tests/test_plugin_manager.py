@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import os
+
+from git_helper.plugin_manager import PluginManager
+from git_helper.utils.settings import SettingsManager
+
+PLUGIN_SOURCE = '''
+from git_helper.plugin_manager import Plugin
+
+
+def register(git=None):
+    return Plugin(name="{name}", description="test plug-in", run=lambda git, app: "{name} ran")
+'''
+
+
+def test_discover_reuses_results_until_plugins_change(tmp_path):
+    plugin_dir = tmp_path / "plugins"
+    plugin_dir.mkdir()
+    plugin_file = plugin_dir / "sample_plugin.py"
+    plugin_file.write_text(PLUGIN_SOURCE.format(name="Sample"))
+    settings = SettingsManager(path=tmp_path / "settings.json")
+    manager = PluginManager(None, search_paths=[plugin_dir], settings=settings)
+
+    first = manager.discover(force=True)
+    assert {"CodeBreakAnalyzer", "Sample"} <= {state.plugin.name for state in first}
+    assert manager.discover(force=True) is first
+
+    plugin_file.write_text(PLUGIN_SOURCE.format(name="Renamed"))
+    stat = plugin_file.stat()
+    os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    names = {state.plugin.name for state in manager.discover(force=True)}
+    assert "Renamed" in names
+    assert "Sample" not in names
+
+    manager.disable("Renamed")
+    states = {state.plugin.name: state.enabled for state in manager.discover(force=True)}
+    assert states["Renamed"] is False
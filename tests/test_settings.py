@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from git_helper.utils.settings import SettingsManager
+
+
+def test_settings_manager_tracks_disabled_plugins(tmp_path):
+    settings_file = tmp_path / "settings.json"
+    settings = SettingsManager(path=settings_file)
+    assert settings.is_plugin_enabled("alpha")
+
+    settings.disable_plugin("beta")
+    settings.disable_plugin("alpha")
+    settings.disable_plugin("alpha")
+    assert not settings.is_plugin_enabled("alpha")
+    assert settings.disabled_plugins() == ("alpha", "beta")
+
+    settings.enable_plugin("alpha")
+    settings.enable_plugin("missing")
+    reloaded = SettingsManager(path=settings_file)
+    assert reloaded.disabled_plugins() == ("beta",)
+    assert not reloaded.is_plugin_enabled("beta")
+    assert reloaded.is_plugin_enabled("alpha")
+
+
+def test_settings_manager_recovers_from_corrupt_file(tmp_path):
+    settings_file = tmp_path / "settings.json"
+    settings_file.write_text("{not json", encoding="utf-8")
+    settings = SettingsManager(path=settings_file)
+    assert settings.get("theme") == "system"
+    assert settings.disabled_plugins() == ()
+
+
+def test_settings_manager_does_not_mutate_defaults(tmp_path):
+    settings = SettingsManager(path=tmp_path / "settings.json")
+    settings.data["window"]["width"] = 640
+
+    fresh = SettingsManager(path=tmp_path / "other.json")
+    assert fresh.get("window") == {"width": 1280, "height": 720}
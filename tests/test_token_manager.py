@@ -32,6 +32,8 @@ def test_token_manager_store_and_require(fake_keyring):
     assert manager.require(scopes=["repo"], scope_provider=scope_provider) == "ghp_secret"
     with pytest.raises(TokenManagerError):
         manager.require(scopes=["admin:org"], scope_provider=scope_provider)
+    with pytest.raises(TokenManagerError, match="missing required scopes: admin:org, gist$"):
+        manager.require(scopes=["gist", "repo", "admin:org", "gist"], scope_provider=scope_provider)
     description = manager.describe(scope_provider=scope_provider)
     assert "repo" in description
     manager.delete()
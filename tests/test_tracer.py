@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from git_helper.tracer import FunctionTracer
+
+
+def test_trace_function_records_calls_and_nested_types():
+    tracer = FunctionTracer()
+    tracer.trace_function("load", {"name": "repo", "tags": ["a", "b"]}, 3, metadata={"source": "test"}, flag=True)
+
+    (event,) = tracer.call_stack()
+    assert event.function == "load"
+    assert event.arg_types == ["dict", "int"]
+    assert event.kwarg_types == {"flag": "bool"}
+    assert event.metadata == {"source": "test"}
+
+    usage = tracer.type_usage()
+    assert sorted(usage["str"]) == ["a", "b", "name", "repo", "tags"]
+    assert usage["int"] == ["3"]
+    assert usage["bool"] == ["True"]
+
+    tracer.reset()
+    assert list(tracer.call_stack()) == []
+    assert tracer.type_usage() == {}
+
+
+def test_track_nested_types_handles_deep_nesting():
+    nested: list = [1]
+    for _ in range(5000):
+        nested = [nested]
+    tracer = FunctionTracer()
+    tracer.trace_function("deep", nested)
+    assert tracer.type_usage()["int"] == ["1"]
+
+
+def test_call_stack_limit_returns_most_recent_calls():
+    tracer = FunctionTracer()
+    for index in range(5):
+        tracer.trace_function(f"call_{index}", index)
+    assert [event.function for event in tracer.call_stack(limit=2)] == ["call_3", "call_4"]
+    assert len(list(tracer.call_stack())) == 5
+
+
+def test_trace_function_without_metadata_shares_read_only_mapping():
+    tracer = FunctionTracer()
+    tracer.trace_function("first")
+    tracer.trace_function("second", metadata={})
+    first, second = tracer.call_stack()
+    assert first.metadata == {}
+    assert first.metadata is second.metadata
+
+
+def test_track_nested_types_stops_on_cycles():
+    looped: list = ["x"]
+    looped.append(looped)
+    mapping: dict = {"key": 1}
+    mapping["self"] = mapping
+    tracer = FunctionTracer()
+    tracer.trace_function("cyclic", looped, mapping)
+    usage = tracer.type_usage()
+    assert usage["str"] == ["x", "key", "self"]
+    assert usage["int"] == ["1"]
+
+
+def test_track_nested_types_counts_shared_sub_containers_each_time():
+    row = [0]
+    pair = (1, 2)
+    tracer = FunctionTracer()
+    tracer.trace_function("shared", [row, row], {"a": pair, "b": pair})
+    usage = tracer.type_usage()
+    assert usage["int"] == ["0", "0", "1", "2", "1", "2"]
+    assert usage["str"] == ["a", "b"]
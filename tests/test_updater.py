@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import io
+import json
+
+from git_helper.utils import updater
+
+
+class _Response(io.BytesIO):
+    def __init__(self, payload: dict, etag: str) -> None:
+        super().__init__(json.dumps(payload).encode("utf-8"))
+        self.headers = {"ETag": etag}
+
+
+def test_check_for_update_reuses_cached_release(tmp_path, monkeypatch):
+    monkeypatch.setenv("GITHELPER_CONFIG_DIR", str(tmp_path))
+    requests = []
+
+    def fake_urlopen(request, timeout):
+        requests.append(request)
+        return _Response({"tag_name": "v2.1.0", "html_url": "https://example.invalid/r", "body": ""}, '"abc"')
+
+    monkeypatch.setattr(updater, "urlopen", fake_urlopen)
+
+    release = updater.check_for_update("2.0.0")
+    assert release is not None and release.tag_name == "v2.1.0"
+    assert updater.check_for_update("2.1.0") is None
+    assert len(requests) == 1
+
+    cache = json.loads((tmp_path / "update-cache.json").read_text(encoding="utf-8"))
+    cache["checked_at"] -= updater.UPDATE_CHECK_TTL
+    (tmp_path / "update-cache.json").write_text(json.dumps(cache), encoding="utf-8")
+    updater.check_for_update("2.0.0")
+    assert len(requests) == 2
+    assert requests[1].get_header("If-none-match") == '"abc"'
+
+
+def test_start_update_check_async_resolves_future(monkeypatch):
+    release = updater.ReleaseInfo(tag_name="v9.9.9", html_url="https://example.invalid/r", body="")
+    monkeypatch.setattr(updater, "check_for_update", lambda current_version: release)
+    exit_hooks = []
+    monkeypatch.setattr(updater.atexit, "register", lambda func, *args: exit_hooks.append((func, args)))
+    future = updater.start_update_check_async("2.0.0")
+    assert future.result(timeout=5) is release
+    ((join, args),) = exit_hooks
+    assert args == (updater.UPDATE_CHECK_EXIT_WAIT,)
+    join(*args)